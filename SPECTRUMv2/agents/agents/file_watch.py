@@ -6,6 +6,11 @@ from typing import Dict, Any
 from ..base import Agent
 from ..schemas import Event
 
+try:
+    from watchfiles import awatch
+except Exception:  # optional: fall back to polling the input dirs
+    awatch = None
+
 class FileWatchAgent(Agent):
     name = "file_watch"
 
@@ -14,25 +19,57 @@ class FileWatchAgent(Agent):
         loop_hz = float(self.cfg.get("runtime", {}).get("loop_hz", 2))
         sleep_s = max(1.0, 1.0 / loop_hz)
 
+        targets = []
+        for spec in inputs:
+            if not spec.get("enabled", True):
+                continue
+            path = spec.get("path")
+            if not path:
+                continue
+            targets.append((spec.get("name","local_files"), path))
+
+        if awatch is not None and targets:
+            try:
+                await self._watch(targets, sleep_s)
+                return
+            except Exception:
+                self.log.warning("File watcher unavailable; polling local_files instead", exc_info=True)
+
         while not self.bus.stopped():
-            for spec in inputs:
-                if not spec.get("enabled", True):
-                    continue
-                path = spec.get("path")
-                if not path:
-                    continue
+            for name, path in targets:
                 os.makedirs(path, exist_ok=True)
-                await self._scan_dir(spec.get("name","local_files"), path)
+                await self._scan_dir(name, path)
             await asyncio.sleep(sleep_s)
 
+    async def _watch(self, targets, sleep_s: float) -> None:
+        """Rescan only when the kernel reports a change; the timeout just lets us notice stop()."""
+        for name, path in targets:
+            os.makedirs(path, exist_ok=True)
+            await self._scan_dir(name, path)
+        async for changes in awatch(
+            *[path for _, path in targets],
+            watch_filter=None,
+            recursive=False,
+            rust_timeout=int(sleep_s * 1000),
+            yield_on_timeout=True,
+        ):
+            if self.bus.stopped():
+                return
+            if not changes:
+                continue
+            for name, path in targets:
+                await self._scan_dir(name, path)
+
     async def _scan_dir(self, name: str, path: str) -> None:
         try:
             emitted = 0
-            for fn in os.listdir(path):
-                fp = os.path.join(path, fn)
-                if os.path.isdir(fp):
-                    continue
-                st = os.stat(fp)
+            # scandir carries the entry type, so only regular files pay for a stat call
+            with os.scandir(path) as it:
+                entries = [entry for entry in it if not entry.is_dir()]
+            for entry in entries:
+                fn = entry.name
+                fp = entry.path
+                st = entry.stat()
                 key = f"file:{fp}:{int(st.st_mtime)}:{st.st_size}"
                 if self.store.seen(key):
                     continue
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Dict, Iterable
+from typing import Dict, Iterable, Optional
 
 BAND_WEIGHTS: Dict[str, float] = {
     "GAMMA": 1.9,
@@ -41,25 +41,38 @@ BAND_CONFIDENCE_CAP = {
     "AM": 0.6,
 }
 
+# Canonical spellings map to themselves so the common case skips str.upper().
+_BAND_KEYS: Dict[str, str] = {band: band for band in BAND_WEIGHTS}
+_BAND_KEYS.update({band.lower(): band for band in BAND_WEIGHTS})
 
-def band_weight(band: str | None) -> float:
+
+def band_key(band: str | None) -> Optional[str]:
     if not band:
+        return None
+    return _BAND_KEYS.get(band) or band.upper()
+
+
+def band_weight(band: str | None) -> float:
+    key = band_key(band)
+    if not key:
         return 1.0
-    return float(BAND_WEIGHTS.get(band.upper(), 1.0))
+    return float(BAND_WEIGHTS.get(key, 1.0))
 
 
 def confidence_cap(band: str | None) -> float:
-    if not band:
+    key = band_key(band)
+    if not key:
         return 1.0
-    return float(BAND_CONFIDENCE_CAP.get(band.upper(), 1.0))
+    return float(BAND_CONFIDENCE_CAP.get(key, 1.0))
 
 
 def dominant_band(bands: Iterable[str]) -> str:
     best = ""
     score = -1
+    priority = BAND_PRIORITY.get
     for band in bands:
-        key = str(band or "").upper()
-        if key and BAND_PRIORITY.get(key, 0) > score:
+        key = band_key(str(band or ""))
+        if key and priority(key, 0) > score:
             best = key
-            score = BAND_PRIORITY.get(key, 0)
+            score = priority(key, 0)
     return best
@@ -2,7 +2,12 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Tuple
+
+# (payload key, attribute, converter) for fields that are always emitted.
+RequiredSpec = Tuple[Tuple[str, str, Optional[Callable[[Any], Any]]], ...]
+# (attribute, converter, emit when falsy but not None) for fields emitted only when set.
+OptionalSpec = Tuple[Tuple[str, Optional[Callable[[Any], Any]], bool], ...]
 
 
 def _iso(ts: Optional[str] = None) -> str:
@@ -11,7 +16,7 @@ def _iso(ts: Optional[str] = None) -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
-@dataclass
+@dataclass(slots=True)
 class BaseObject:
     id: str
     type: str
@@ -23,28 +28,39 @@ class BaseObject:
     tags: Optional[List[str]] = None
     notes: Optional[str] = None
 
+    _BASE_OPTIONAL: ClassVar[OptionalSpec] = (
+        ("updated_at", None, False),
+        ("band", None, False),
+        ("confidence", float, True),
+        ("labels", list, False),
+        ("tags", list, False),
+        ("notes", None, False),
+    )
+    _REQUIRED: ClassVar[RequiredSpec] = ()
+    _OPTIONAL: ClassVar[OptionalSpec] = ()
+
     def to_dict(self) -> Dict[str, Any]:
         payload: Dict[str, Any] = {
             "id": self.id,
             "type": self.type,
             "created_at": self.created_at,
         }
-        if self.updated_at:
-            payload["updated_at"] = self.updated_at
-        if self.band:
-            payload["band"] = self.band
-        if self.confidence is not None:
-            payload["confidence"] = float(self.confidence)
-        if self.labels:
-            payload["labels"] = list(self.labels)
-        if self.tags:
-            payload["tags"] = list(self.tags)
-        if self.notes:
-            payload["notes"] = self.notes
+        self._emit_optional(payload, self._BASE_OPTIONAL)
+        for key, attr, convert in self._REQUIRED:
+            value = getattr(self, attr)
+            payload[key] = convert(value) if convert else value
+        self._emit_optional(payload, self._OPTIONAL)
         return payload
 
+    def _emit_optional(self, payload: Dict[str, Any], spec: OptionalSpec) -> None:
+        for attr, convert, keep_falsy in spec:
+            value = getattr(self, attr)
+            if value is None or (not keep_falsy and not value):
+                continue
+            payload[attr] = convert(value) if convert else value
 
-@dataclass
+
+@dataclass(slots=True)
 class Artifact(BaseObject):
     uri: str = ""
     captured_at: str = field(default_factory=_iso)
@@ -55,58 +71,44 @@ class Artifact(BaseObject):
     local_path: Optional[str] = None
     mime_hint: Optional[str] = None
 
+    _REQUIRED: ClassVar[RequiredSpec] = (
+        ("uri", "uri", None),
+        ("captured_at", "captured_at", None),
+        ("content_type", "content_type", None),
+        ("source", "source", None),
+    )
+    _OPTIONAL: ClassVar[OptionalSpec] = (
+        ("hashes", None, False),
+        ("size_bytes", int, True),
+        ("local_path", None, False),
+        ("mime_hint", None, False),
+    )
+
     def __post_init__(self) -> None:
         self.type = "artifact"
 
-    def to_dict(self) -> Dict[str, Any]:
-        payload = super().to_dict()
-        payload.update(
-            {
-                "type": "artifact",
-                "uri": self.uri,
-                "captured_at": self.captured_at,
-                "content_type": self.content_type,
-                "source": self.source,
-            }
-        )
-        if self.hashes:
-            payload["hashes"] = self.hashes
-        if self.size_bytes is not None:
-            payload["size_bytes"] = int(self.size_bytes)
-        if self.local_path:
-            payload["local_path"] = self.local_path
-        if self.mime_hint:
-            payload["mime_hint"] = self.mime_hint
-        return payload
 
-
-@dataclass
+@dataclass(slots=True)
 class Signal(BaseObject):
     signal_type: str = ""
     value: Any = None
     normalized: Any = None
     evidence: Optional[List[Dict[str, Any]]] = None
 
+    _REQUIRED: ClassVar[RequiredSpec] = (
+        ("signal_type", "signal_type", None),
+        ("value", "value", None),
+    )
+    _OPTIONAL: ClassVar[OptionalSpec] = (
+        ("normalized", None, True),
+        ("evidence", list, False),
+    )
+
     def __post_init__(self) -> None:
         self.type = "signal"
 
-    def to_dict(self) -> Dict[str, Any]:
-        payload = super().to_dict()
-        payload.update(
-            {
-                "type": "signal",
-                "signal_type": self.signal_type,
-                "value": self.value,
-            }
-        )
-        if self.normalized is not None:
-            payload["normalized"] = self.normalized
-        if self.evidence:
-            payload["evidence"] = list(self.evidence)
-        return payload
 
-
-@dataclass
+@dataclass(slots=True)
 class Entity(BaseObject):
     entity_type: str = ""
     name: str = ""
@@ -114,28 +116,21 @@ class Entity(BaseObject):
     attributes: Optional[Dict[str, Any]] = None
     evidence: Optional[List[Dict[str, Any]]] = None
 
+    _REQUIRED: ClassVar[RequiredSpec] = (
+        ("entity_type", "entity_type", None),
+        ("name", "name", None),
+    )
+    _OPTIONAL: ClassVar[OptionalSpec] = (
+        ("aliases", list, False),
+        ("attributes", dict, False),
+        ("evidence", list, False),
+    )
+
     def __post_init__(self) -> None:
         self.type = "entity"
 
-    def to_dict(self) -> Dict[str, Any]:
-        payload = super().to_dict()
-        payload.update(
-            {
-                "type": "entity",
-                "entity_type": self.entity_type,
-                "name": self.name,
-            }
-        )
-        if self.aliases:
-            payload["aliases"] = list(self.aliases)
-        if self.attributes:
-            payload["attributes"] = dict(self.attributes)
-        if self.evidence:
-            payload["evidence"] = list(self.evidence)
-        return payload
 
-
-@dataclass
+@dataclass(slots=True)
 class Edge(BaseObject):
     from_id: str = ""
     to_id: str = ""
@@ -144,28 +139,22 @@ class Edge(BaseObject):
     direction: Optional[str] = None
     evidence: Optional[List[Dict[str, Any]]] = None
 
+    _REQUIRED: ClassVar[RequiredSpec] = (
+        ("from", "from_id", None),
+        ("to", "to_id", None),
+        ("edge_type", "edge_type", None),
+        ("weight", "weight", float),
+    )
+    _OPTIONAL: ClassVar[OptionalSpec] = (
+        ("direction", None, False),
+        ("evidence", list, False),
+    )
+
     def __post_init__(self) -> None:
         self.type = "edge"
 
-    def to_dict(self) -> Dict[str, Any]:
-        payload = super().to_dict()
-        payload.update(
-            {
-                "type": "edge",
-                "from": self.from_id,
-                "to": self.to_id,
-                "edge_type": self.edge_type,
-                "weight": float(self.weight),
-            }
-        )
-        if self.direction:
-            payload["direction"] = self.direction
-        if self.evidence:
-            payload["evidence"] = list(self.evidence)
-        return payload
 
-
-@dataclass
+@dataclass(slots=True)
 class Event(BaseObject):
     event_type: str = ""
     time_start: str = field(default_factory=_iso)
@@ -174,68 +163,54 @@ class Event(BaseObject):
     evidence: Optional[List[Dict[str, Any]]] = None
     metrics: Optional[Dict[str, Any]] = None
 
+    _REQUIRED: ClassVar[RequiredSpec] = (
+        ("event_type", "event_type", None),
+        ("time_start", "time_start", None),
+    )
+    _OPTIONAL: ClassVar[OptionalSpec] = (
+        ("time_end", None, False),
+        ("participants", list, False),
+        ("evidence", list, False),
+        ("metrics", dict, False),
+    )
+
     def __post_init__(self) -> None:
         self.type = "event"
 
-    def to_dict(self) -> Dict[str, Any]:
-        payload = super().to_dict()
-        payload.update(
-            {
-                "type": "event",
-                "event_type": self.event_type,
-                "time_start": self.time_start,
-            }
-        )
-        if self.time_end:
-            payload["time_end"] = self.time_end
-        if self.participants:
-            payload["participants"] = list(self.participants)
-        if self.evidence:
-            payload["evidence"] = list(self.evidence)
-        if self.metrics:
-            payload["metrics"] = dict(self.metrics)
-        return payload
 
-
-@dataclass
+@dataclass(slots=True)
 class Claim(BaseObject):
     text: str = ""
     claim_type: Optional[str] = None
     about: Optional[List[str]] = None
     evidence: Optional[List[Dict[str, Any]]] = None
 
+    _REQUIRED: ClassVar[RequiredSpec] = (("text", "text", None),)
+    _OPTIONAL: ClassVar[OptionalSpec] = (
+        ("claim_type", None, False),
+        ("about", list, False),
+        ("evidence", list, False),
+    )
+
     def __post_init__(self) -> None:
         self.type = "claim"
 
-    def to_dict(self) -> Dict[str, Any]:
-        payload = super().to_dict()
-        payload.update({"type": "claim", "text": self.text})
-        if self.claim_type:
-            payload["claim_type"] = self.claim_type
-        if self.about:
-            payload["about"] = list(self.about)
-        if self.evidence:
-            payload["evidence"] = list(self.evidence)
-        return payload
 
-
-@dataclass
+@dataclass(slots=True)
 class Cluster(BaseObject):
     cluster_type: str = ""
     members: List[str] = field(default_factory=list)
     centroid: Optional[Dict[str, Any]] = None
     evidence: Optional[List[Dict[str, Any]]] = None
 
+    _REQUIRED: ClassVar[RequiredSpec] = (
+        ("cluster_type", "cluster_type", None),
+        ("members", "members", list),
+    )
+    _OPTIONAL: ClassVar[OptionalSpec] = (
+        ("centroid", dict, False),
+        ("evidence", list, False),
+    )
+
     def __post_init__(self) -> None:
         self.type = "cluster"
-
-    def to_dict(self) -> Dict[str, Any]:
-        payload = super().to_dict()
-        payload.update(
-            {"type": "cluster", "cluster_type": self.cluster_type, "members": list(self.members)}
-        )
-        if self.centroid:
-            payload["centroid"] = dict(self.centroid)
-        if self.evidence:
-            payload["evidence"] = list(self.evidence)
-        return payload
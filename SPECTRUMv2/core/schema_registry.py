@@ -13,12 +13,14 @@ class SchemaRegistry:
     base_dir: Path
     schemas: Dict[str, Dict[str, Any]] = field(default_factory=dict)
     validators: Dict[str, Draft202012Validator] = field(default_factory=dict)
+    intel_validators: Dict[str, Draft202012Validator] = field(default_factory=dict)
 
     def register(self, name: str, path: Path) -> None:
         payload = json.loads(path.read_text(encoding="utf-8"))
         Draft202012Validator.check_schema(payload)
         self.schemas[name] = payload
         self.validators[name] = Draft202012Validator(payload)
+        self.intel_validators.pop(name, None)
 
     def validator(self, name: str) -> Draft202012Validator:
         if name not in self.validators:
@@ -26,6 +28,9 @@ class SchemaRegistry:
         return self.validators[name]
 
     def intel_object_validator(self, name: str) -> Draft202012Validator:
+        cached = self.intel_validators.get(name)
+        if cached is not None:
+            return cached
         if name not in self.schemas:
             raise KeyError(f"Schema not registered: {name}")
         schema = self.schemas[name]
@@ -36,7 +41,9 @@ class SchemaRegistry:
             "$ref": "#/$defs/IntelObject",
         }
         Draft202012Validator.check_schema(obj_schema)
-        return Draft202012Validator(obj_schema)
+        validator = Draft202012Validator(obj_schema)
+        self.intel_validators[name] = validator
+        return validator
 
 
 def load_default_registry() -> SchemaRegistry:
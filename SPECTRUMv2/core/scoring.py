@@ -3,7 +3,15 @@ from __future__ import annotations
 import math
 from typing import Any, Dict, Iterable, List, Tuple
 
-from core.band import band_weight, confidence_cap, dominant_band
+from core.band import band_key, band_weight, confidence_cap, dominant_band
+
+try:
+    import numpy as np
+except Exception:  # pragma: no cover - numpy is optional for small batches
+    np = None
+
+# Batches smaller than this stay on the scalar path; array setup costs more than it saves.
+VECTORIZE_MIN_BATCH = 256
 
 
 def _clamp(value: float, lo: float = 0.0, hi: float = 1.0) -> float:
@@ -18,6 +26,49 @@ def _as_list(value: Any) -> List:
     return [value]
 
 
+def _scalar_confidences(
+    base: List[float],
+    band_w: List[float],
+    evidence_counts: List[int],
+    cross_flags: List[bool],
+    denial_flags: List[bool],
+    caps: List[float],
+    evidence_boost: float,
+    cross_band_boost: float,
+    contradiction_penalty: float,
+) -> List[float]:
+    out: List[float] = []
+    for i, conf in enumerate(base):
+        confidence = conf + (evidence_counts[i] * evidence_boost)
+        if cross_flags[i]:
+            confidence += cross_band_boost
+        if denial_flags[i]:
+            confidence -= contradiction_penalty
+        confidence *= band_w[i]
+        out.append(_clamp(confidence, 0.0, caps[i]))
+    return out
+
+
+def _vector_confidences(
+    base: List[float],
+    band_w: List[float],
+    evidence_counts: List[int],
+    cross_flags: List[bool],
+    denial_flags: List[bool],
+    caps: List[float],
+    evidence_boost: float,
+    cross_band_boost: float,
+    contradiction_penalty: float,
+) -> List[float]:
+    conf = np.asarray(base, dtype=np.float64)
+    conf += np.asarray(evidence_counts, dtype=np.float64) * evidence_boost
+    conf += np.asarray(cross_flags, dtype=np.float64) * cross_band_boost
+    conf -= np.asarray(denial_flags, dtype=np.float64) * contradiction_penalty
+    conf *= np.asarray(band_w, dtype=np.float64)
+    np.clip(conf, 0.0, np.asarray(caps, dtype=np.float64), out=conf)
+    return conf.tolist()
+
+
 def score_objects(
     objects: Iterable[Dict[str, Any]],
     scoring_cfg: Dict[str, Any],
@@ -31,41 +82,64 @@ def score_objects(
     cross_band_boost = float(confidence_rules.get("cross_band_boost", 0.0))
     contradiction_penalty = float(confidence_rules.get("contradiction_penalty", 0.0))
 
+    # Gather per-object inputs column-wise so the arithmetic can run as one pass.
     scored: List[Dict[str, Any]] = []
+    bands: List[str | None] = []
+    base: List[float] = []
+    band_w: List[float] = []
+    evidence_counts: List[int] = []
+    cross_flags: List[bool] = []
+    denial_flags: List[bool] = []
+    caps: List[float] = []
+    _bw = band_weights.get
+    _bl = band_lookup.get
+    _cap = confidence_cap
     for obj in objects:
-        obj_type = obj.get("type")
-        band = str(obj.get("band") or band_lookup.get(obj.get("id")) or "").upper() or None
+        band = band_key(str(obj.get("band") or _bl(obj.get("id")) or ""))
         base_conf = obj.get("confidence")
         if base_conf is None:
             base_conf = 0.5
-        base_conf = _clamp(float(base_conf))
-        band_w = float(band_weights.get(band, band_weight(band)))
+        base.append(_clamp(float(base_conf)))
+        band_w.append(float(_bw(band, band_weight(band))))
 
         evidence = _as_list(obj.get("evidence"))
-        evidence_ids = [e.get("artifact_id") for e in evidence if isinstance(e, dict)]
-        evidence_ids = [e for e in evidence_ids if e]
-        evidence_count = len(set(evidence_ids))
-        confidence = base_conf + (evidence_count * evidence_boost)
+        evidence_ids = {e["artifact_id"] for e in evidence if isinstance(e, dict) and e.get("artifact_id")}
+        evidence_counts.append(len(evidence_ids))
 
+        cross = False
         if evidence_ids:
-            evidence_bands = {band_lookup.get(eid) for eid in evidence_ids if band_lookup.get(eid)}
-            if len(evidence_bands) > 1:
-                confidence += cross_band_boost
-
-        if obj_type == "claim" and obj.get("claim_type") == "DENIAL":
-            confidence -= contradiction_penalty
+            evidence_bands = {b for eid in evidence_ids if (b := _bl(eid))}
+            cross = len(evidence_bands) > 1
+        cross_flags.append(cross)
+        denial_flags.append(obj.get("type") == "claim" and obj.get("claim_type") == "DENIAL")
+        caps.append(_cap(band))
+        bands.append(band)
+        scored.append(obj)
 
-        confidence *= band_w
-        confidence = _clamp(confidence, 0.0, confidence_cap(band))
+    compute = _scalar_confidences
+    if np is not None and len(scored) >= VECTORIZE_MIN_BATCH:
+        compute = _vector_confidences
+    confidences = compute(
+        base,
+        band_w,
+        evidence_counts,
+        cross_flags,
+        denial_flags,
+        caps,
+        evidence_boost,
+        cross_band_boost,
+        contradiction_penalty,
+    )
+
+    for obj, band, bw, confidence in zip(scored, bands, band_w, confidences):
         obj["confidence"] = round(confidence, 4)
         if band:
             obj["band"] = band
 
-        if obj_type == "edge":
+        if obj.get("type") == "edge":
             edge_type = obj.get("edge_type")
-            base = float(edge_weight_rules.get(edge_type, obj.get("weight") or 10.0))
-            obj["weight"] = round(base * (1.0 + math.log1p(band_w)), 3)
-        scored.append(obj)
+            base_weight = float(edge_weight_rules.get(edge_type, obj.get("weight") or 10.0))
+            obj["weight"] = round(base_weight * (1.0 + math.log1p(bw)), 3)
 
     return scored
 
@@ -76,10 +150,10 @@ def build_band_index(objects: Iterable[Dict[str, Any]]) -> Dict[str, str]:
         obj_id = obj.get("id")
         band = obj.get("band")
         if obj_id and band:
-            mapping[obj_id] = str(band).upper()
+            mapping[obj_id] = band_key(str(band))
     return mapping
 
 
 def dominant_band_for_objects(objects: Iterable[Dict[str, Any]]) -> str:
-    bands = [str(o.get("band") or "").upper() for o in objects if o.get("band")]
+    bands = [band_key(str(o.get("band"))) for o in objects if o.get("band")]
     return dominant_band(bands)
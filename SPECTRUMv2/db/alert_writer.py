@@ -45,20 +45,27 @@ def _ensure_alerts_table(conn) -> None:
     conn.commit()
 
 
-def _isoformat(value: Optional[float | int | str]) -> str:
+def _isoformat(value: Optional[float | int | str], now_iso: Optional[str] = None) -> str:
     if value is None:
-        return datetime.now(timezone.utc).isoformat()
+        return now_iso or datetime.now(timezone.utc).isoformat()
     if isinstance(value, (int, float)):
         return datetime.fromtimestamp(float(value), tz=timezone.utc).isoformat()
     text = str(value).strip()
     if not text:
-        return datetime.now(timezone.utc).isoformat()
+        return now_iso or datetime.now(timezone.utc).isoformat()
     return text
 
 
-def _hash_payload(payload: Dict[str, Any]) -> str:
-    raw = json.dumps(payload, sort_keys=True, default=str)
-    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+# json.dumps builds a fresh encoder on every call once kwargs are passed; reuse
+# one. Stored payloads always use this canonical (key-sorted) form.
+_CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True, default=str)
+
+
+def _hash_payload(payload: Dict[str, Any]) -> tuple[str, str]:
+    # Returns the canonical JSON too, so the caller stores it instead of serializing again.
+    raw = _CANONICAL_ENCODER.encode(payload)
+    # ensure_ascii output, so the ASCII codec yields the same bytes as UTF-8.
+    return hashlib.sha256(raw.encode("ascii")).hexdigest(), raw
 
 
 def write_alerts(
@@ -71,12 +78,16 @@ def write_alerts(
         days = int(os.getenv("ACE_T_RETENTION_DAYS") or "30")
     except Exception:
         days = 30
-    conn.execute("DELETE FROM alerts WHERE detected_at < datetime('now', ?)", (f"-{days} days",))
     rows: List[tuple] = []
+    now_iso = datetime.now(timezone.utc).isoformat()
     for alert in alerts:
         payload = alert.get("payload") or {}
-        content_hash = alert.get("content_hash") or _hash_payload(payload)
-        detected_at = _isoformat(alert.get("detected_at"))
+        content_hash = alert.get("content_hash")
+        if content_hash:
+            raw_payload = _CANONICAL_ENCODER.encode(payload)
+        else:
+            content_hash, raw_payload = _hash_payload(payload)
+        detected_at = _isoformat(alert.get("detected_at"), now_iso)
         rows.append(
             (
                 content_hash,
@@ -85,19 +96,23 @@ def write_alerts(
                 detected_at,
                 alert.get("first_seen"),
                 alert.get("last_seen"),
-                json.dumps(payload, default=str),
+                raw_payload,
             )
         )
     if not rows:
+        conn.close()
         return 0
-    conn.executemany(
-        """
-        INSERT OR IGNORE INTO alerts
-        (content_hash, simhash, source_name, detected_at, first_seen, last_seen, payload)
-        VALUES (?, ?, ?, ?, ?, ?, ?)
-        """,
-        rows,
-    )
-    conn.commit()
+    # Retention purge and insert share one write transaction (one sync).
+    with conn:
+        conn.execute("BEGIN IMMEDIATE")
+        conn.execute("DELETE FROM alerts WHERE detected_at < datetime('now', ?)", (f"-{days} days",))
+        conn.executemany(
+            """
+            INSERT OR IGNORE INTO alerts
+            (content_hash, simhash, source_name, detected_at, first_seen, last_seen, payload)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            rows,
+        )
     conn.close()
     return len(rows)
@@ -7,11 +7,23 @@ from typing import Iterable, Optional
 DEFAULT_DB_PATH = Path(__file__).resolve().parent / "osint.db"
 DEFAULT_SCHEMA_PATH = Path(__file__).resolve().parent / "schema.sql"
 
+# Ingest writes in batches: WAL with synchronous=NORMAL syncs once per checkpoint
+# instead of on every commit, and readers no longer block the writer.
+_CONNECT_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-20000",
+)
+
 def connect(db_path: Optional[Path] = None) -> sqlite3.Connection:
     db_path = db_path or DEFAULT_DB_PATH
     db_path.parent.mkdir(parents=True, exist_ok=True)
     conn = sqlite3.connect(str(db_path))
     conn.row_factory = sqlite3.Row
+    for pragma in _CONNECT_PRAGMAS:
+        conn.execute(pragma)
     return conn
 
 def init_db(conn: sqlite3.Connection, schema_path: Optional[Path] = None) -> None:
@@ -33,14 +33,14 @@ def _ensure_iocs_table(conn) -> None:
     conn.commit()
 
 
-def _isoformat(value: Optional[float | int | str]) -> str:
+def _isoformat(value: Optional[float | int | str], now_iso: Optional[str] = None) -> str:
     if value is None:
-        return datetime.now(timezone.utc).isoformat()
+        return now_iso or datetime.now(timezone.utc).isoformat()
     if isinstance(value, (int, float)):
         return datetime.fromtimestamp(float(value), tz=timezone.utc).isoformat()
     text = str(value).strip()
     if not text:
-        return datetime.now(timezone.utc).isoformat()
+        return now_iso or datetime.now(timezone.utc).isoformat()
     return text
 
 
@@ -51,8 +51,8 @@ def write_iocs(iocs: Iterable[Dict[str, Any]], db_path: Optional[Path] = None) -
         days = int(os.getenv("ACE_T_RETENTION_DAYS") or "30")
     except Exception:
         days = 30
-    conn.execute("DELETE FROM iocs WHERE last_seen < datetime('now', ?)", (f"-{days} days",))
     rows = []
+    now_iso = datetime.now(timezone.utc).isoformat()
     for ioc in iocs:
         ioc_hash = ioc.get("ioc_hash")
         if not ioc_hash:
@@ -62,8 +62,8 @@ def write_iocs(iocs: Iterable[Dict[str, Any]], db_path: Optional[Path] = None) -
         source_feed = str(ioc.get("source_feed") or "").strip()
         if not indicator or not ioc_type or not source_feed:
             continue
-        first_seen = _isoformat(ioc.get("first_seen"))
-        last_seen = _isoformat(ioc.get("last_seen") or ioc.get("first_seen"))
+        first_seen = _isoformat(ioc.get("first_seen"), now_iso)
+        last_seen = _isoformat(ioc.get("last_seen") or ioc.get("first_seen"), now_iso)
         confidence = int(float(ioc.get("confidence", 50)))
         severity = str(ioc.get("severity") or "medium").lower()
         metadata = json.dumps(ioc.get("metadata") or {}, default=str)
@@ -85,14 +85,17 @@ def write_iocs(iocs: Iterable[Dict[str, Any]], db_path: Optional[Path] = None) -
     if not rows:
         conn.close()
         return 0
-    conn.executemany(
-        """
-        INSERT OR IGNORE INTO iocs
-        (ioc_hash, indicator, ioc_type, source_feed, first_seen, last_seen, confidence, severity, ioc_metadata, tags)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-        rows,
-    )
-    conn.commit()
+    # Retention purge and insert share one write transaction (one sync).
+    with conn:
+        conn.execute("BEGIN IMMEDIATE")
+        conn.execute("DELETE FROM iocs WHERE last_seen < datetime('now', ?)", (f"-{days} days",))
+        conn.executemany(
+            """
+            INSERT OR IGNORE INTO iocs
+            (ioc_hash, indicator, ioc_type, source_feed, first_seen, last_seen, confidence, severity, ioc_metadata, tags)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            rows,
+        )
     conn.close()
     return len(rows)
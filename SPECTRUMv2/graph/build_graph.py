@@ -1,7 +1,9 @@
 import json
+import functools
 import hashlib
 import math
 import os
+import re
 import sys
 import csv
 import io
@@ -160,7 +162,7 @@ async def simple_fetch_threatfox():
                     'sector': 'ThreatFox',
                     'country': '',
                     'subsource': normalized_type,
-                    'discovered': discovered or datetime.now().isoformat(),
+                    'discovered': discovered or _fallback_now(f'threatfox:{indicator}'),
                     'description': f"ThreatFox {normalized_type}: {indicator} - {metadata.get('malware_printable', metadata.get('malware', 'unknown'))}",
                     'source_url': f"https://threatfox.abuse.ch/browse.php?search=ioc:{indicator}",
                     'url': indicator if normalized_type == 'url' else None,
@@ -320,25 +322,47 @@ def _normalize_category_key(value: str) -> str:
         return ''
     return str(value).strip().lower()
 
+# Normalized category names, computed once instead of per lookup.
+_CATEGORY_COLOR_KEYS = tuple(
+    (_normalize_category_key(name), color) for name, color in CATEGORY_COLORS.items()
+)
+
 def _category_color_for(value: str) -> str | None:
     if not value:
         return None
-    key = _normalize_category_key(value)
-    for name, color in CATEGORY_COLORS.items():
-        if _normalize_category_key(name) == key:
+    return _category_color_for_key(_normalize_category_key(value))
+
+# Sector labels repeat heavily across nodes and streaming ticks.
+@functools.lru_cache(maxsize=256)
+def _category_color_for_key(key: str) -> str | None:
+    for needle, color in _CATEGORY_COLOR_KEYS:
+        if needle == key:
             return color
     # Fuzzy match for composite labels
-    for name, color in CATEGORY_COLORS.items():
-        needle = _normalize_category_key(name)
+    for needle, color in _CATEGORY_COLOR_KEYS:
         if needle and needle in key:
             return color
     return None
 
+# First time each undated record was seen. Records without a source timestamp
+# keep that value on later loads, so re-reading unchanged inputs yields an
+# identical graph instead of one restamped with the current time.
+_FALLBACK_TS = {}
+_FALLBACK_TS_MAX = 200_000
+
+def _fallback_now(key: str) -> str:
+    ts = _FALLBACK_TS.get(key)
+    if ts is None:
+        if len(_FALLBACK_TS) >= _FALLBACK_TS_MAX:
+            _FALLBACK_TS.clear()
+        ts = _FALLBACK_TS[key] = datetime.now().isoformat()
+    return ts
+
 def _stable_rng(seed: str) -> float:
     if seed is None:
         seed = ''
-    digest = hashlib.md5(str(seed).encode('utf-8')).hexdigest()
-    return int(digest[:8], 16) / 0xFFFFFFFF
+    digest = hashlib.md5(str(seed).encode('utf-8')).digest()
+    return int.from_bytes(digest[:4], 'big') / 0xFFFFFFFF
 
 def _normalize_source_name(value: str) -> str:
     if value is None:
@@ -350,7 +374,8 @@ def _is_threatfox_source(value: str) -> bool:
     return 'threatfox' in key
 
 def _tf_h32(text: str) -> int:
-    return int(hashlib.sha1(str(text).encode('utf-8', 'ignore')).hexdigest()[:8], 16)
+    # First 4 digest bytes, big-endian: same value as int(hexdigest()[:8], 16) without the hex round trip.
+    return int.from_bytes(hashlib.sha1(str(text).encode('utf-8', 'ignore')).digest()[:4], 'big')
 
 def _tf_unit(text: str) -> float:
     return (_tf_h32(text) % 10000) / 10000.0
@@ -361,18 +386,20 @@ def _tf_norm(value) -> str:
 def _tf_parse_ts(value):
     if not value:
         return None
-    text = str(value).replace('Z', '+00:00')
+    text = str(value)
     try:
         if text.isdigit():
             return float(text)
-        return datetime.fromisoformat(text).timestamp()
+        return datetime.fromisoformat(text.replace('Z', '+00:00')).timestamp()
     except Exception:
         return None
 
+_TF_TS_KEYS = ('last_observed', 'first_observed', 'first_seen', 'last_seen', 'timestamp', 'created', 'date', 'posted_at')
+
 def _tf_get_node_ts(node: dict):
-    for key in ('last_observed', 'first_observed', 'first_seen', 'last_seen', 'timestamp', 'created', 'date', 'posted_at'):
-        ts = _tf_parse_ts(node.get(key))
-        if ts:
+    get = node.get
+    for key in _TF_TS_KEYS:
+        if (raw := get(key)) and (ts := _tf_parse_ts(raw)):
             return ts
     return None
 
@@ -713,6 +740,10 @@ def _contains_ransomware(text: str) -> bool:
     lowered = str(text).lower()
     return any(keyword in lowered for keyword in RANSOMWARE_KEYWORDS)
 
+# Plain epoch strings ("1700000000", "1700000000123.5"); matched before the ISO parser
+# so the common numeric case does not pay for a raised ValueError.
+_NUMERIC_TS_MATCH = re.compile(r'-?\d+(?:\.\d+)?').fullmatch
+
 def _parse_datetime(value):
     if value is None:
         return None
@@ -729,6 +760,13 @@ def _parse_datetime(value):
         raw = value.strip()
         if not raw:
             return None
+        if _NUMERIC_TS_MATCH(raw):
+            numeric = float(raw)
+            if numeric > 1_000_000_000_000:
+                return datetime.fromtimestamp(numeric / 1000.0, tz=timezone.utc)
+            if numeric > 1_000_000_000:
+                return datetime.fromtimestamp(numeric, tz=timezone.utc)
+            # Short digit runs may still be compact ISO dates (YYYYMMDD).
         try:
             return datetime.fromisoformat(raw.replace('Z', '+00:00')).astimezone(timezone.utc)
         except Exception:
@@ -1196,7 +1234,7 @@ def load_twitter_threats():
             'group': 'Unknown',
             'sector': 'Unknown',
             'country': 'Unknown',
-            'discovered': item.get('date', datetime.now().isoformat()),
+            'discovered': item['date'] if 'date' in item else _fallback_now(f'twitter:{key}'),
             'description': f"Twitter threat: {item.get('type', 'unknown')} - {item.get('value', '')}",
             'url': item.get('tweet'),
             'ioc_type': item.get('type'),
@@ -1352,7 +1390,7 @@ def load_threatfox():
                                 'sector': 'ThreatFox',
                                 'country': '',
                                 'subsource': normalized_type,
-                                'discovered': discovered or datetime.now().isoformat(),
+                                'discovered': discovered or _fallback_now(f'threatfox:{indicator}'),
                                 'description': f"ThreatFox {normalized_type}: {indicator} - {metadata.get('malware_printable', metadata.get('malware', 'unknown'))}",
                                 'source_url': f"https://threatfox.abuse.ch/browse.php?search={indicator}",
                                 'url': indicator if normalized_type == 'url' else None,
@@ -1478,7 +1516,7 @@ def load_urlhaus():
             'sector': 'URLhaus',
             'country': '',
             'subsource': 'url',
-            'discovered': date_added or datetime.now().isoformat(),
+            'discovered': date_added or _fallback_now(f'urlhaus:{url_value}'),
             'description': ' | '.join(description_parts),
             'source_url': urlhaus_link or url_value,
             'url': url_value,
@@ -1543,7 +1581,7 @@ def load_feodotracker():
         ip_value = _get(row, 'dst_ip') or _get(row, 'ip_address') or _get(row, 'ip')
         if not ip_value:
             continue
-        first_seen = _get(row, 'first_seen_utc') or _get(row, 'firstseen') or datetime.now().isoformat()
+        first_seen = _get(row, 'first_seen_utc') or _get(row, 'firstseen') or _fallback_now(f'feodo:{ip_value}')
         last_online = _get(row, 'last_online') or _get(row, 'lastseen')
         malware = _get(row, 'malware') or _get(row, 'threat') or 'Unknown'
         status = _get(row, 'status') or _get(row, 'c2_status') or ''
@@ -1664,27 +1702,31 @@ def _is_law_match(*values: str) -> bool:
             return True
     return False
 
+_CANONICAL_SOURCE_COLORS = {
+    'ransomware.live': '#ff3b30',
+    'abuse.ch threatfox': '#39ff14',
+    'abuse.ch urlhaus': '#00c8ff',
+    'abuse.ch feodotracker': '#b7ff2d',
+    'abuse.ch ja3': '#5eead4',
+    'c2intelfeeds': '#a78bfa',
+    'montysecurity c2 tracker': '#f59e0b',
+    'carbon black c2': '#fb7185',
+    'shadowpad c2': '#f97316',
+    'blocklist.de': '#22d3ee',
+    'ipsum': '#60a5fa',
+    'alienvault': '#8b5cf6',
+    'proofpoint': '#ef4444',
+    'cisa kev': '#facc15',
+    'nvd cve': '#818cf8',
+}
+
+# Pure in its input and called per node; the source vocabulary is small.
+@functools.lru_cache(maxsize=256)
 def _source_color_for(source: str) -> str:
     key = (source or '').lower()
     if not key:
         return '#00E5FF'
-    canonical = {
-        'ransomware.live': '#ff3b30',
-        'abuse.ch threatfox': '#39ff14',
-        'abuse.ch urlhaus': '#00c8ff',
-        'abuse.ch feodotracker': '#b7ff2d',
-        'abuse.ch ja3': '#5eead4',
-        'c2intelfeeds': '#a78bfa',
-        'montysecurity c2 tracker': '#f59e0b',
-        'carbon black c2': '#fb7185',
-        'shadowpad c2': '#f97316',
-        'blocklist.de': '#22d3ee',
-        'ipsum': '#60a5fa',
-        'alienvault': '#8b5cf6',
-        'proofpoint': '#ef4444',
-        'cisa kev': '#facc15',
-        'nvd cve': '#818cf8',
-    }
+    canonical = _CANONICAL_SOURCE_COLORS
     if key in canonical:
         return canonical[key]
     if 'threatfox' in key:
@@ -1807,7 +1849,7 @@ def _load_infrastructure_intel_records() -> list:
         if not indicator:
             continue
         ioc_type = str(entry.get('indicator_type') or 'unknown').strip().lower()
-        first_seen = entry.get('first_seen') or datetime.now().isoformat()
+        first_seen = entry.get('first_seen') or _fallback_now(f'infra:{source}:{indicator}')
         last_seen = entry.get('last_seen') or first_seen
         meta = entry.get('metadata') or {}
         tags = entry.get('tags') if isinstance(entry.get('tags'), list) else []
@@ -1905,6 +1947,19 @@ def _build_render_edges(edges: list, max_edges_per_node: int = 6, allowed_types=
         counts[t] = counts.get(t, 0) + 1
     return selected
 
+# Parsed original SPECTRUM graph, keyed on (st_mtime_ns, st_size); the streaming
+# loop calls load_all_raw_records every poll and this file rarely changes.
+_ORIGINAL_GRAPH_CACHE = {'key': None, 'data': None}
+
+def _load_original_graph(path: Path) -> dict:
+    st = path.stat()
+    key = (st.st_mtime_ns, st.st_size)
+    if _ORIGINAL_GRAPH_CACHE['key'] != key:
+        with open(path, 'r') as f:
+            _ORIGINAL_GRAPH_CACHE['data'] = json.load(f)
+        _ORIGINAL_GRAPH_CACHE['key'] = key
+    return _ORIGINAL_GRAPH_CACHE['data']
+
 def load_all_raw_records():
     """Load all raw threat records from ACE-T intel bundle."""
     raw_records = []
@@ -1982,7 +2037,7 @@ def load_all_raw_records():
                                 'group': group or 'Unknown',
                                 'sector': sector or 'Unknown',
                                 'country': country or 'Unknown',
-                                'discovered': obj.get('created_at', datetime.now().isoformat()),
+                                'discovered': obj['created_at'] if 'created_at' in obj else _fallback_now(f'intel:{name}'),
                                 'description': f"Ransomware-related entity: {name}",
                                 'url': name if name.startswith('http') else None
                             }
@@ -2122,8 +2177,7 @@ def load_all_raw_records():
     original_graph_path = PROJECT_ROOT / 'clean_project' / 'data' / 'graph_3d.json'
     if original_graph_path.exists() and _is_allowed_source('Original SPECTRUM Graph'):
         try:
-            with open(original_graph_path, 'r') as f:
-                original_data = json.load(f)
+            original_data = _load_original_graph(original_graph_path)
 
             nodes = original_data.get('nodes', [])
             for node in nodes:
@@ -2142,7 +2196,7 @@ def load_all_raw_records():
                     'group': node.get('band', 'Unknown'),
                     'sector': node.get('subsource', 'Unknown'),
                     'country': 'Unknown',  # Original data doesn't have country
-                    'discovered': datetime.fromtimestamp(node.get('timestamp', 0)).isoformat() if node.get('timestamp') else datetime.now().isoformat(),
+                    'discovered': datetime.fromtimestamp(node.get('timestamp', 0)).isoformat() if node.get('timestamp') else _fallback_now(f"spectrum:{node.get('id')}"),
                     'description': f"Original SPECTRUM entity: {node.get('label', 'Unknown')}",
                     'url': node.get('source_url'),
                     'spectrum_data': node  # Keep original spectrum properties
@@ -2659,8 +2713,8 @@ def build_graph():
                 'source_key': spectrum_node.get('subsource') or spectrum_source,
                 'subsource': spectrum_node.get('subsource', ''),
                 'source_url': spectrum_node.get('source_url'),
-                'first_observed': datetime.fromtimestamp(spectrum_node.get('timestamp', 0)).isoformat() if spectrum_node.get('timestamp') else datetime.now().isoformat(),
-                'last_observed': datetime.fromtimestamp(spectrum_node.get('timestamp', 0)).isoformat() if spectrum_node.get('timestamp') else datetime.now().isoformat(),
+                'first_observed': datetime.fromtimestamp(spectrum_node.get('timestamp', 0)).isoformat() if spectrum_node.get('timestamp') else _fallback_now(f"spectrum:{spectrum_node.get('id')}"),
+                'last_observed': datetime.fromtimestamp(spectrum_node.get('timestamp', 0)).isoformat() if spectrum_node.get('timestamp') else _fallback_now(f"spectrum:{spectrum_node.get('id')}"),
                 'description': f"Original SPECTRUM: {spectrum_node.get('label', 'Unknown')}",
                 'posted_at': datetime.fromtimestamp(spectrum_node.get('timestamp', 0)).isoformat() if spectrum_node.get('timestamp') else None,
                 'last_activity': datetime.fromtimestamp(spectrum_node.get('timestamp', 0)).isoformat() if spectrum_node.get('timestamp') else None,
@@ -2704,7 +2758,7 @@ def build_graph():
         country = record.get('country') or 'Unknown'
         source = record.get('source') or 'Unknown'
         source_key = _normalize_source_name(source)
-        first_observed = record.get('discovered') or record.get('first_seen') or record.get('timestamp') or datetime.now().isoformat()
+        first_observed = record.get('discovered') or record.get('first_seen') or record.get('timestamp') or _fallback_now(f'record:{source}:{group}:{victim_name}')
         last_observed = record.get('last_seen') or first_observed
         description = record.get('description') or record.get('notes') or 'Ransomware victim listing'
         if isinstance(description, str) and description.strip().lower() in {'n/a', 'na', 'unknown', 'unknown victim'}:
@@ -2912,6 +2966,11 @@ def build_graph_streaming(batch_size=1, delay_between_batches=0.5, poll_interval
         except:
             last_count = 0
 
+    # Digest of the records behind the last written graph; unchanged ticks skip
+    # rebuilding the graph and rewriting its files on disk. The files keep their
+    # mtime, so launch_viewer's gzip cache stays warm and polls revalidate to 304s.
+    last_digest = None
+
     while True:
         # Load all raw records using SPECTRUM approach
         raw_records = load_all_raw_records()
@@ -2938,6 +2997,14 @@ def build_graph_streaming(batch_size=1, delay_between_batches=0.5, poll_interval
             # All enabled Tier-1 feeds are first-class threat graph sources.
             threat_records.append(r)
 
+        records_digest = hashlib.sha1(
+            json.dumps([total_records, threat_records], sort_keys=True, default=str).encode('utf-8')
+        ).digest()
+        if records_digest == last_digest:
+            time.sleep(poll_interval)
+            continue
+        last_digest = records_digest
+
         # Create nodes for threat incidents according to SPECTRUM node contract
         nodes = []
         for i, record in enumerate(threat_records):
@@ -2960,8 +3027,8 @@ def build_graph_streaming(batch_size=1, delay_between_batches=0.5, poll_interval
                     'source_key': spectrum_node.get('subsource') or spectrum_source,
                     'subsource': spectrum_node.get('subsource', ''),
                     'source_url': spectrum_node.get('source_url'),
-                    'first_observed': datetime.fromtimestamp(spectrum_node.get('timestamp', 0)).isoformat() if spectrum_node.get('timestamp') else datetime.now().isoformat(),
-                    'last_observed': datetime.fromtimestamp(spectrum_node.get('timestamp', 0)).isoformat() if spectrum_node.get('timestamp') else datetime.now().isoformat(),
+                    'first_observed': datetime.fromtimestamp(spectrum_node.get('timestamp', 0)).isoformat() if spectrum_node.get('timestamp') else _fallback_now(f"spectrum:{spectrum_node.get('id')}"),
+                    'last_observed': datetime.fromtimestamp(spectrum_node.get('timestamp', 0)).isoformat() if spectrum_node.get('timestamp') else _fallback_now(f"spectrum:{spectrum_node.get('id')}"),
                     'description': f"Original SPECTRUM: {spectrum_node.get('label', 'Unknown')}",
                     'posted_at': datetime.fromtimestamp(spectrum_node.get('timestamp', 0)).isoformat() if spectrum_node.get('timestamp') else None,
                     'last_activity': datetime.fromtimestamp(spectrum_node.get('timestamp', 0)).isoformat() if spectrum_node.get('timestamp') else None,
@@ -3007,7 +3074,7 @@ def build_graph_streaming(batch_size=1, delay_between_batches=0.5, poll_interval
             country = record.get('country') or 'Unknown'
             source = record.get('source') or 'Unknown'
             source_key = _normalize_source_name(source)
-            first_observed = record.get('discovered') or record.get('first_seen') or record.get('timestamp') or datetime.now().isoformat()
+            first_observed = record.get('discovered') or record.get('first_seen') or record.get('timestamp') or _fallback_now(f'record:{source}:{group}:{victim_name}')
             last_observed = record.get('last_seen') or first_observed
             description = record.get('description') or record.get('notes') or ''
 
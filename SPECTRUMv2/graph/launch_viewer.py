@@ -9,7 +9,10 @@ import webbrowser
 import subprocess
 import signal
 import sys
+import stat
 import functools
+import gzip
+import io
 import shutil
 import json
 import time
@@ -33,6 +36,61 @@ def _python_executable() -> str:
         return configured
     return sys.executable
 
+# Vendored three.js modules only change with a repo update; let browsers reuse
+# them for an hour instead of revalidating each module import on every load.
+VENDOR_PREFIX = '/three/vendor/'
+VENDOR_CACHE_CONTROL = 'public, max-age=3600'
+DEFAULT_CACHE_CONTROL = 'no-cache, must-revalidate, max-age=0'
+
+# Short-lived existence probes for WEB_DIR lookups; every asset request would
+# otherwise stat the primary directory before falling back.
+_EXISTS_CACHE = {}
+_EXISTS_TTL_S = 1.0
+_EXISTS_CACHE_MAX = 1024
+
+
+def _cached_exists(path: Path) -> bool:
+    now = time.monotonic()
+    hit = _EXISTS_CACHE.get(path)
+    if hit is not None and hit[0] > now:
+        return hit[1]
+    if len(_EXISTS_CACHE) >= _EXISTS_CACHE_MAX:
+        _EXISTS_CACHE.clear()
+    exists = path.exists()
+    _EXISTS_CACHE[path] = (now + _EXISTS_TTL_S, exists)
+    return exists
+
+
+# Graph JSON compresses several-fold; compress each file version once and serve
+# the same bytes to every gzip-capable poll until the file changes.
+GZIP_MIN_BYTES = 1024
+GZIP_LEVEL = 6
+_GZIP_CACHE = {}
+
+
+def _accepts_gzip(accept_encoding) -> bool:
+    for token in (accept_encoding or '').split(','):
+        name, _, params = token.partition(';')
+        if name.strip().lower() != 'gzip':
+            continue
+        q = params.replace(' ', '').lower()
+        return q not in ('q=0', 'q=0.0', 'q=0.00', 'q=0.000')
+    return False
+
+
+def _gzip_cached(path: str):
+    """Return (gzipped bytes, stat) for ``path``, reusing the cached copy while unchanged."""
+    with open(path, 'rb') as f:
+        st = os.fstat(f.fileno())
+        key = (st.st_mtime_ns, st.st_size)
+        hit = _GZIP_CACHE.get(path)
+        if hit is not None and hit[0] == key:
+            return hit[1], st
+        body = gzip.compress(f.read(), compresslevel=GZIP_LEVEL)
+    _GZIP_CACHE[path] = (key, body)
+    return body, st
+
+
 def _resolve_static_path(url_path: str) -> Path:
     url_path = urlsplit(url_path).path
     if url_path.startswith('/'):
@@ -42,7 +100,7 @@ def _resolve_static_path(url_path: str) -> Path:
     if url_path.startswith('data/'):
         return BASE_DIR / url_path
     candidate = WEB_DIR / url_path
-    if candidate.exists():
+    if _cached_exists(candidate):
         return candidate
     return FALLBACK_WEB_DIR / url_path
 
@@ -85,11 +143,50 @@ def _mark_auto_open(url: str) -> None:
         pass
 
 class CustomHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
+    _etag = None
+
     def do_GET(self):
         if self.path == '/' or self.path == '':
             self.path = '/ace_t_spectrum_3d.html'
         super().do_GET()
 
+    def send_head(self):
+        # Weak validator from the file's mtime/size; a repeat poll with a
+        # matching If-None-Match gets a 304 instead of the full body.
+        self._etag = None
+        path = self.translate_path(self.path)
+        try:
+            st = os.stat(path)
+        except OSError:
+            return super().send_head()
+        if stat.S_ISREG(st.st_mode):
+            self._etag = f'W/"{st.st_mtime_ns:x}-{st.st_size:x}"'
+            if_none_match = self.headers.get('If-None-Match')
+            if if_none_match and (
+                if_none_match.strip() == '*'
+                or self._etag in (tag.strip() for tag in if_none_match.split(','))
+            ):
+                self.send_response(http.server.HTTPStatus.NOT_MODIFIED)
+                self.end_headers()
+                return None
+            if (
+                path.endswith('.json')
+                and st.st_size >= GZIP_MIN_BYTES
+                and _accepts_gzip(self.headers.get('Accept-Encoding'))
+            ):
+                try:
+                    body, st = _gzip_cached(path)
+                except OSError:
+                    return super().send_head()
+                self.send_response(http.server.HTTPStatus.OK)
+                self.send_header('Content-type', self.guess_type(path))
+                self.send_header('Content-Encoding', 'gzip')
+                self.send_header('Content-Length', str(len(body)))
+                self.send_header('Last-Modified', self.date_time_string(st.st_mtime))
+                self.end_headers()
+                return io.BytesIO(body)
+        return super().send_head()
+
     def translate_path(self, path: str) -> str:
         return str(_resolve_static_path(path))
 
@@ -98,8 +195,17 @@ class CustomHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
         self.send_header('Access-Control-Allow-Origin', '*')
         self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
         self.send_header('Access-Control-Allow-Headers', 'X-Requested-With')
-        self.send_header('Cache-Control', 'no-store, no-cache, must-revalidate, max-age=0')
-        self.send_header('Pragma', 'no-cache')
+        if self._etag and urlsplit(self.path).path.startswith(VENDOR_PREFIX):
+            self.send_header('Cache-Control', VENDOR_CACHE_CONTROL)
+        else:
+            # Revalidate on every request (never serve stale graph data) but allow
+            # the browser to keep the body so unchanged files come back as 304s.
+            self.send_header('Cache-Control', DEFAULT_CACHE_CONTROL)
+            self.send_header('Pragma', 'no-cache')
+        if self._etag:
+            self.send_header('ETag', self._etag)
+            if urlsplit(self.path).path.endswith('.json'):
+                self.send_header('Vary', 'Accept-Encoding')
         super().end_headers()
 
 def start_streaming_build():
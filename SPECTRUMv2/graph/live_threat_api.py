@@ -4,52 +4,190 @@ Live Threat API Server
 Provides REST endpoints for adding threats to the live monitoring system.
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
+from flask.json.provider import DefaultJSONProvider
 from pathlib import Path
+from collections import deque
 import json
 from datetime import datetime
+import logging
 import os
 import subprocess
 import threading
 import sys
 
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+try:
+    import fcntl
+except Exception:  # non-POSIX
+    fcntl = None
+
+class _OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson; same sorted keys and default hook."""
+
+    def dumps(self, obj, **kwargs):
+        # Datetimes go through Flask's default hook so they keep the HTTP-date format.
+        option = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        return orjson.dumps(obj, default=self.default, option=option).decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity; the stdlib accepts them (and raises the usual error otherwise).
+            return super().loads(s, **kwargs)
+
 app = Flask(__name__)
+if orjson is not None:
+    app.json = _OrjsonProvider(app)
+
+def _json_bytes(payload) -> bytes:
+    # Sorted, compact keys match Flask's default JSON provider.
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+def _json_response(payload, status: int = 200):
+    """Serialize straight to bytes with orjson when available; jsonify otherwise."""
+    if orjson is None:
+        return jsonify(payload), status
+    return Response(_json_bytes(payload), status=status, mimetype="application/json")
+
+# Static error bodies, encoded once; a failing client or probe loop hits these repeatedly.
+_ERR_NO_JSON_400 = (_json_bytes({"error": "No JSON data provided"}), 400)
+_ERR_INTERNAL_500 = (_json_bytes({"error": "Internal server error"}), 500)
+
+def _err(blob):
+    body, status = blob
+    return Response(body, status=status, mimetype="application/json")
+
+# Parsed tail of the live feed, keyed on the file's (st_mtime_ns, st_size).
+_THREATS_CACHE = {"key": None, "threats": [], "body": None}
+_THREATS_CACHE_LOCK = threading.Lock()
+
+def _recent_threats(live_feed: Path, limit: int = 100):
+    """Return the last ``limit`` threats, re-parsing only when the file changed."""
+    st = os.stat(live_feed)
+    key = (st.st_mtime_ns, st.st_size)
+    with _THREATS_CACHE_LOCK:
+        if _THREATS_CACHE["key"] == key:
+            return _THREATS_CACHE["threats"]
+        # Stream the feed and keep only the tail, so memory stays bounded as the file grows.
+        tail = deque(maxlen=limit)
+        with open(live_feed, 'r') as f:
+            for line in f:
+                if line.strip():
+                    tail.append(json.loads(line.strip()))
+        threats = list(tail)
+        _THREATS_CACHE["key"] = key
+        _THREATS_CACHE["threats"] = threats
+        _THREATS_CACHE["body"] = None
+        return threats
+
+def _recent_threats_body(live_feed: Path) -> bytes:
+    """Serialized GET /threats body, reused until the feed changes."""
+    threats = _recent_threats(live_feed)
+    with _THREATS_CACHE_LOCK:
+        if _THREATS_CACHE["threats"] is threats and _THREATS_CACHE["body"] is not None:
+            return _THREATS_CACHE["body"]
+    body = _json_bytes({"threats": threats})
+    with _THREATS_CACHE_LOCK:
+        if _THREATS_CACHE["threats"] is threats:
+            _THREATS_CACHE["body"] = body
+    return body
+
+# Scoring and rebuilds already run out of process; lower their priority so a
+# rebuild does not starve the request threads of CPU.
+_CHILD_NICENESS = 10
+
+def _run_background(cmd):
+    proc = subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, cwd=os.getcwd()
+    )
+    if hasattr(os, 'setpriority'):
+        try:
+            os.setpriority(os.PRIO_PROCESS, proc.pid, _CHILD_NICENESS)
+        except OSError:
+            pass
+    stdout, stderr = proc.communicate()
+    return subprocess.CompletedProcess(cmd, proc.returncode, stdout, stderr)
 
 def process_new_threat():
     """Automatically process new threats: score and rebuild graph"""
     try:
-        print("🔄 Processing new threat: scoring...")
+        app.logger.info("Processing new threat: scoring")
         py_bin = os.environ.get("PYTHON_BIN", "").strip() or sys.executable
         # Run scoring
-        result = subprocess.run(
-            [py_bin, 'score_live_threats.py'],
-            capture_output=True, text=True, cwd=os.getcwd()
-        )
+        result = _run_background([py_bin, 'score_live_threats.py'])
         if result.returncode == 0:
-            print("✅ Scoring completed")
+            app.logger.info("Scoring completed")
         else:
-            print(f"❌ Scoring failed: {result.stderr}")
+            app.logger.error("Scoring failed: %s", result.stderr)
 
         if os.environ.get('ACE_T_STREAMING_GRAPH', '1') != '1':
-            print("🔄 Rebuilding graph...")
+            app.logger.info("Rebuilding graph")
             # Run graph building
-            result = subprocess.run(
-                [py_bin, 'build_graph.py'],
-                capture_output=True, text=True, cwd=os.getcwd()
-            )
+            result = _run_background([py_bin, 'build_graph.py'])
             if result.returncode == 0:
-                print("✅ Graph rebuilt")
+                app.logger.info("Graph rebuilt")
             else:
-                print(f"❌ Graph build failed: {result.stderr}")
+                app.logger.error("Graph build failed: %s", result.stderr)
         else:
-            print("🔄 Streaming graph enabled; skipping batch rebuild.")
+            app.logger.debug("Streaming graph enabled; skipping batch rebuild")
 
     except Exception as e:
-        print(f"❌ Processing error: {e}")
+        app.logger.error("Processing error: %s", e)
+
+# Serializes appends from concurrent request threads; the advisory flock also
+# keeps other processes from interleaving with a partially written line.
+_LIVE_FEED_LOCK = threading.Lock()
+
+def _append_threat(live_feed: Path, threat_data) -> None:
+    line = json.dumps(threat_data) + '\n'
+    with _LIVE_FEED_LOCK, open(live_feed, 'a') as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            f.write(line)
+            f.flush()
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+# One processing worker at a time; posts that land mid-run set the pending flag
+# so the worker does a single extra pass instead of starting a duplicate rebuild.
+_PROCESS_LOCK = threading.Lock()
+_PROCESS_PENDING = threading.Event()
+
+def _process_worker():
+    while True:
+        try:
+            while _PROCESS_PENDING.is_set():
+                _PROCESS_PENDING.clear()
+                process_new_threat()
+        finally:
+            _PROCESS_LOCK.release()
+        # A post may have arrived between the last check and the release.
+        if not _PROCESS_PENDING.is_set() or not _PROCESS_LOCK.acquire(blocking=False):
+            return
+
+def _schedule_processing():
+    _PROCESS_PENDING.set()
+    if _PROCESS_LOCK.acquire(blocking=False):
+        threading.Thread(target=_process_worker).start()
+
+# The health payload never changes; serialize it once for probe loops.
+_HEALTH_BODY = json.dumps(
+    {"service": "spectrum-ace-t-live-threat-api", "status": "healthy"}, separators=(",", ":")
+).encode("utf-8")
 
 @app.route('/health', methods=['GET'])
 def health():
-    return jsonify({"status": "healthy", "service": "spectrum-ace-t-live-threat-api"})
+    return Response(_HEALTH_BODY, mimetype="application/json")
 
 @app.route('/threats', methods=['POST'])
 def add_threat():
@@ -61,7 +199,7 @@ def add_threat():
         threat_data = request.get_json()
 
         if not threat_data:
-            return jsonify({"error": "No JSON data provided"}), 400
+            return _err(_ERR_NO_JSON_400)
 
         # Validate required fields
         required_fields = ['src_ip', 'dst_ip', 'protocol']
@@ -79,11 +217,10 @@ def add_threat():
         live_feed = Path("live_threats.jsonl")
         live_feed.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(live_feed, 'a') as f:
-            f.write(json.dumps(threat_data) + '\n')
+        _append_threat(live_feed, threat_data)
 
         # Trigger automatic processing in background
-        threading.Thread(target=process_new_threat).start()
+        _schedule_processing()
 
         return jsonify({
             "status": "success",
@@ -93,31 +230,29 @@ def add_threat():
 
     except Exception:
         app.logger.error("Unhandled exception while adding threat", exc_info=True)
-        return jsonify({"error": "Internal server error"}), 500
+        return _err(_ERR_INTERNAL_500)
 
 @app.route('/threats', methods=['GET'])
 def get_threats():
     """Get recent threats (last 100)"""
     try:
-        live_feed = Path("live_threats.jsonl")
-        if not live_feed.exists():
-            return jsonify({"threats": []})
-
-        threats = []
-        with open(live_feed, 'r') as f:
-            for line in f:
-                if line.strip():
-                    threats.append(json.loads(line.strip()))
-
-        # Return last 100 threats
-        return jsonify({"threats": threats[-100:]})
+        # Return last 100 threats; a missing feed surfaces from the single stat()
+        # in _recent_threats rather than a separate exists() probe.
+        try:
+            body = _recent_threats_body(Path("live_threats.jsonl"))
+        except FileNotFoundError:
+            return _json_response({"threats": []})
+        return Response(body, mimetype="application/json")
 
     except Exception:
         app.logger.error("Unhandled exception while retrieving threats", exc_info=True)
-        return jsonify({"error": "Internal server error"}), 500
+        return _err(_ERR_INTERNAL_500)
 
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5000))
+    # Flask's logger defaults to WARNING; surface the per-threat INFO lines.
+    logging.basicConfig(level=logging.INFO)
+    app.logger.setLevel(logging.INFO)
     print(f"🚀 SPECTRUM ACE-T Live Threat API Server starting on port {port}")
     print("Endpoints:")
     print("  GET  /health - Health check")
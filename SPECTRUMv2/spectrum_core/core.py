@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import colorsys
+import functools
 import math
 from typing import Optional
 
@@ -36,15 +37,17 @@ def _log_invalid(label: str, value: object, context: Optional[str]) -> None:
     print(f"[spectrum_core] clamp {label} value={value!r}{ctx}")
 
 
+SEVERITY_BAND_WEIGHTS = {
+    "low": 0.2,
+    "medium": 0.45,
+    "high": 0.7,
+    "critical": 0.92,
+}
+
+
 def band_weight_from_severity(severity: str | None, fallback: float = 0.35) -> float:
     sev = str(severity or "").strip().lower()
-    mapping = {
-        "low": 0.2,
-        "medium": 0.45,
-        "high": 0.7,
-        "critical": 0.92,
-    }
-    return clamp01(mapping.get(sev, fallback), fallback)
+    return clamp01(SEVERITY_BAND_WEIGHTS.get(sev, fallback), fallback)
 
 
 def _norm_count(value: float | int | None, scale: float) -> float:
@@ -137,6 +140,7 @@ def spectral_color(
     return f"#{int(r * 255):02x}{int(g * 255):02x}{int(b * 255):02x}"
 
 
+@functools.lru_cache(maxsize=256)
 def _hex_to_rgb(hex_color: str) -> Optional[tuple[float, float, float]]:
     if not hex_color:
         return None
@@ -5,6 +5,8 @@ import json
 import math
 import time
 import os
+import sys
+import tempfile
 import ipaddress
 import re
 from urllib.parse import urlparse
@@ -36,6 +38,16 @@ try:
 except Exception:
     SOURCE_COLORS = {}
 
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+try:
+    import ahocorasick  # pyahocorasick; optional multi-pattern matcher for cross-source links
+except Exception:
+    ahocorasick = None
+
 OUT_PATH = Path(__file__).resolve().parent.parent.parent / "data" / "graph_data.json"
 POS_CACHE = OUT_PATH.with_name("graph_positions.json")
 
@@ -64,19 +76,53 @@ def _hash_float(key: str, salt: str, lo: float, hi: float) -> float:
     return lo + (hi - lo) * n
 
 
+def _atomic_write_json(path: Path, payload, *, compact: bool = False) -> None:
+    """
+    Stream JSON into a unique sibling temp file through a 1 MiB buffer, then swap it into place.
+    Compact output drops indentation for machine-only files such as the position cache.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".", suffix=".tmp")
+    try:
+        os.fchmod(fd, 0o644)
+        with open(fd, "w", encoding="utf-8", buffering=1 << 20) as fh:
+            if compact:
+                json.dump(payload, fh, separators=(",", ":"))
+            else:
+                json.dump(payload, fh, indent=2)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
 def _load_saved_positions() -> Dict[str, Dict[str, float]]:
     """
     Load any previously persisted positions from graph_data.json or graph_positions.json.
     Supports both element lists and simple {id: {x, y}} mappings.
     """
     positions: Dict[str, Dict[str, float]] = {}
+    cache_mtime = None
     for path in (POS_CACHE, OUT_PATH):
-        if not path.exists():
+        try:
+            mtime = path.stat().st_mtime_ns
+        except OSError:
+            continue
+        # Both files are written together; only parse the full graph when the cache is older.
+        if path is OUT_PATH and positions and cache_mtime is not None and cache_mtime >= mtime:
             continue
         try:
-            payload = json.loads(path.read_text(encoding="utf-8"))
+            raw = path.read_bytes()
+            try:
+                payload = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            except ValueError:
+                payload = json.loads(raw)  # stdlib also accepts NaN/Infinity
         except Exception:
             continue
+        if path is POS_CACHE:
+            cache_mtime = mtime
 
         if isinstance(payload, dict) and all(isinstance(v, dict) for v in payload.values()):
             for nid, pos in payload.items():
@@ -269,12 +315,19 @@ def emit_graph(nodes: Iterable[Dict], edges: Iterable[Dict]) -> None:
     # Pre-compute node domains, source keys, timestamps for enrichment
     node_domain: Dict[str, str] = {}
     node_source_key: Dict[str, str] = {}
+    # Stripped indicator text and its lower-cased match key, derived once for the overlap passes.
+    node_indicator: Dict[str, str] = {}
+    node_indicator_key: Dict[str, str] = {}
     node_ts: Dict[str, float] = {}
     node_band: Dict[str, str] = {}
     node_band_weight: Dict[str, float] = {}
     for nid, n in node_map.items():
         node_domain[nid] = _node_domain(n)
-        node_source_key[nid] = str(n.get("subsource") or n.get("source") or "").strip().lower()
+        # Interned so the per-edge source comparisons below hit the identity fast path.
+        node_source_key[nid] = sys.intern(str(n.get("subsource") or n.get("source") or "").strip().lower())
+        indicator = str(n.get("indicator") or n.get("label") or "").strip()
+        node_indicator[nid] = indicator
+        node_indicator_key[nid] = indicator.lower()
         node_ts[nid] = float(n.get("timestamp", now) or now)
         band = _infer_band(n)
         if band:
@@ -282,7 +335,8 @@ def emit_graph(nodes: Iterable[Dict], edges: Iterable[Dict]) -> None:
             n["band"] = band
         band_w = band_weight(band)
         node_band_weight[nid] = band_w
-        n.setdefault("object_type", n.get("type") or n.get("kind") or "node")
+        if "object_type" not in n:
+            n["object_type"] = n.get("type") or n.get("kind") or "node"
 
     # Signal density: non-duplicate signals per 24h window, grouped by source/subsource
     density_counts: Dict[str, int] = {}
@@ -375,7 +429,8 @@ def emit_graph(nodes: Iterable[Dict], edges: Iterable[Dict]) -> None:
         size = VOLUME_MIN_SIZE + (math.log1p(volume) * VOLUME_SCALE)
         n["size"] = max(VOLUME_MIN_SIZE, min(VOLUME_MAX_SIZE, int(round(size))))
         # Preserve existing color/opacity if set
-        n.setdefault("opacity", 1.0)
+        if "opacity" not in n:
+            n["opacity"] = 1.0
 
         if "position" not in n:
             n_pos = saved_positions.get(nid) or _seed_position(nid, neighbors[nid], saved_positions)
@@ -383,13 +438,18 @@ def emit_graph(nodes: Iterable[Dict], edges: Iterable[Dict]) -> None:
 
     # Cross-source connectors: link Reddit alerts to matching feed indicators
     try:
-        reddit_nodes = [n for n in node_map.values() if str(n.get("source") or "").lower() == "reddit"]
-        other_nodes = [n for n in node_map.values() if str(n.get("source") or "").lower() != "reddit"]
+        reddit_nodes = []
+        other_nodes = []
+        for n in node_map.values():
+            if str(n.get("source") or "").lower() == "reddit":
+                reddit_nodes.append(n)
+            else:
+                other_nodes.append(n)
         indicator_map = {}
         domain_map: Dict[str, set] = {}
         for n in other_nodes:
-            indicator = str(n.get("indicator") or n.get("label") or "").strip()
             node_id = n.get("id")
+            indicator = node_indicator[node_id]
             dom = node_domain.get(node_id) if node_id else ""
             if not dom:
                 dom = _extract_domain(indicator)
@@ -397,9 +457,15 @@ def emit_graph(nodes: Iterable[Dict], edges: Iterable[Dict]) -> None:
                 domain_map.setdefault(dom, set()).add(n.get("id"))
             if len(indicator) < 6:
                 continue
-            key = indicator.lower()
-            indicator_map.setdefault(key, set()).add(n.get("id"))
+            indicator_map.setdefault(node_indicator_key[node_id], set()).add(n.get("id"))
         indicators = list(indicator_map.items())[:2000]
+        # One automaton over all indicators scans each label once instead of once per indicator.
+        matcher = None
+        if ahocorasick is not None and indicators and reddit_nodes:
+            matcher = ahocorasick.Automaton()
+            for idx, (indicator, _node_ids) in enumerate(indicators):
+                matcher.add_word(indicator, idx)
+            matcher.make_automaton()
         for r in reddit_nodes:
             label_text = str(r.get("label") or "")
             label = label_text.lower()
@@ -408,21 +474,25 @@ def emit_graph(nodes: Iterable[Dict], edges: Iterable[Dict]) -> None:
             r_id = r.get("id")
             if not r_id:
                 continue
-            for indicator, node_ids in indicators:
-                if indicator in label:
-                    for nid in node_ids:
-                        if not nid:
-                            continue
-                        eid = f"cross::{nid}→{r_id}"
-                        if eid in edge_map:
-                            continue
-                        edge_map[eid] = {
-                            "id": eid,
-                            "source": nid,
-                            "target": r_id,
-                            "relation": "cross_match",
-                            "weight": 1.8,
-                        }
+            if matcher is not None:
+                # Sorted indices keep edge insertion order identical to the linear scan.
+                hits = [indicators[idx] for idx in sorted({idx for _end, idx in matcher.iter(label)})]
+            else:
+                hits = [(indicator, node_ids) for indicator, node_ids in indicators if indicator in label]
+            for _indicator, node_ids in hits:
+                for nid in node_ids:
+                    if not nid:
+                        continue
+                    eid = f"cross::{nid}→{r_id}"
+                    if eid in edge_map:
+                        continue
+                    edge_map[eid] = {
+                        "id": eid,
+                        "source": nid,
+                        "target": r_id,
+                        "relation": "cross_match",
+                        "weight": 1.8,
+                    }
             domains = set()
             r_domain = node_domain.get(r_id, "")
             if r_domain:
@@ -461,23 +531,23 @@ def emit_graph(nodes: Iterable[Dict], edges: Iterable[Dict]) -> None:
                 continue
             if n.get("kind") not in {"ioc", "alert"}:
                 continue
-            indicator = str(n.get("indicator") or n.get("label") or "").strip()
-            if len(indicator) < 6:
+            nid = n.get("id")
+            if len(node_indicator[nid]) < 6:
                 continue
-            key = indicator.lower()
-            indicator_index.setdefault(key, []).append(n)
+            indicator_index.setdefault(node_indicator_key[nid], []).append(n)
 
         max_edges_per_indicator = 30
         for key, nodes_for_indicator in indicator_index.items():
             if len(nodes_for_indicator) < 2:
                 continue
             # Connect only across different sources/subsources to keep noise low
+            srcs = [sys.intern(str(n.get("subsource") or n.get("source") or "").lower()) for n in nodes_for_indicator]
             for i in range(len(nodes_for_indicator)):
                 a = nodes_for_indicator[i]
                 a_id = a.get("id")
                 if not a_id:
                     continue
-                a_src = str(a.get("subsource") or a.get("source") or "").lower()
+                a_src = srcs[i]
                 for j in range(i + 1, len(nodes_for_indicator)):
                     if max_edges_per_indicator <= 0:
                         break
@@ -485,7 +555,7 @@ def emit_graph(nodes: Iterable[Dict], edges: Iterable[Dict]) -> None:
                     b_id = b.get("id")
                     if not b_id:
                         continue
-                    b_src = str(b.get("subsource") or b.get("source") or "").lower()
+                    b_src = srcs[j]
                     if not a_src or not b_src or a_src == b_src:
                         continue
                     eid = f"overlap::{key}::{a_id}→{b_id}"
@@ -520,6 +590,7 @@ def emit_graph(nodes: Iterable[Dict], edges: Iterable[Dict]) -> None:
         for dom, nodes_for_domain in domain_index.items():
             if len(nodes_for_domain) < 2:
                 continue
+            srcs = [sys.intern(str(n.get("subsource") or n.get("source") or "").lower()) for n in nodes_for_domain]
             for i in range(len(nodes_for_domain)):
                 if max_edges_per_domain <= 0:
                     break
@@ -527,7 +598,7 @@ def emit_graph(nodes: Iterable[Dict], edges: Iterable[Dict]) -> None:
                 a_id = a.get("id")
                 if not a_id:
                     continue
-                a_src = str(a.get("subsource") or a.get("source") or "").lower()
+                a_src = srcs[i]
                 for j in range(i + 1, len(nodes_for_domain)):
                     if max_edges_per_domain <= 0:
                         break
@@ -535,7 +606,7 @@ def emit_graph(nodes: Iterable[Dict], edges: Iterable[Dict]) -> None:
                     b_id = b.get("id")
                     if not b_id:
                         continue
-                    b_src = str(b.get("subsource") or b.get("source") or "").lower()
+                    b_src = srcs[j]
                     if not a_src or not b_src or a_src == b_src:
                         continue
                     eid = f"domain::{dom}::{a_id}→{b_id}"
@@ -591,7 +662,8 @@ def emit_graph(nodes: Iterable[Dict], edges: Iterable[Dict]) -> None:
         edge_band = dominant_band([src_band, tgt_band])
         if edge_band:
             e["band"] = edge_band
-        e.setdefault("object_type", "edge")
+        if "object_type" not in e:
+            e["object_type"] = "edge"
 
     # Spectrum index + convergence (continuous)
     for nid, n in node_map.items():
@@ -683,7 +755,8 @@ def emit_graph(nodes: Iterable[Dict], edges: Iterable[Dict]) -> None:
         e["edge_opacity"] = round(max(0.05, min(0.95, edge_opacity)), 4)
         e["edge_thickness"] = round(0.35 + (2.2 * coherence) * (0.5 + (0.5 * min_spec)), 3)
         # Stable control-point offset keeps bundled edges separated without overdraw
-        curve_base = _hash_float(str(e.get("id", f"{src}-{tgt}")), "curve", -120.0, 120.0)
+        # _hash_float formats the key itself; edges in edge_map always carry their id
+        curve_base = _hash_float(e["id"] if "id" in e else f"{src}-{tgt}", "curve", -120.0, 120.0)
         e["curve_offset"] = curve_base * (0.5 + (dispersion * 1.1) + ((1.0 - min_spec) * 0.6))
 
     elements = []
@@ -704,6 +777,6 @@ def emit_graph(nodes: Iterable[Dict], edges: Iterable[Dict]) -> None:
     validate_elements(elements)
 
     OUT_PATH.parent.mkdir(parents=True, exist_ok=True)
-    OUT_PATH.write_text(json.dumps(elements, indent=2), encoding="utf-8")
+    _atomic_write_json(OUT_PATH, elements)
     if positions_only:
-        POS_CACHE.write_text(json.dumps(positions_only, indent=2), encoding="utf-8")
+        _atomic_write_json(POS_CACHE, positions_only, compact=True)
@@ -52,6 +52,11 @@ except Exception:
     YAML_AVAILABLE = False
     yaml = None
 
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None
+
 
 class _NoopTorEnforcer:
     async def gate_request(self, reason: str = "") -> None:
@@ -188,11 +193,18 @@ def _get_existing_graph() -> tuple[list[dict], list[dict]]:
     if not GRAPH_PATH.exists():
         return [], []
     try:
-        elements = json.loads(GRAPH_PATH.read_text(encoding="utf-8"))
+        raw = GRAPH_PATH.read_bytes()
+        try:
+            elements = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except ValueError:
+            elements = json.loads(raw)  # stdlib also accepts NaN/Infinity
     except Exception:
         return [], []
-    nodes = [e.get("data", {}) for e in elements if not {"source", "target"} <= set((e.get("data") or {}).keys())]
-    edges = [e.get("data", {}) for e in elements if {"source", "target"} <= set((e.get("data") or {}).keys())]
+    nodes: list[dict] = []
+    edges: list[dict] = []
+    for e in elements:
+        data = e.get("data") or {}
+        (edges if "source" in data and "target" in data else nodes).append(data)
     return nodes, edges
 
 
@@ -345,17 +357,11 @@ def _parse_ts(ts: Optional[str]) -> Optional[datetime]:
             return None
 
 
+_SEVERITY_WEIGHTS = {"critical": 4, "high": 3, "medium": 2, "mild": 1}
+
+
 def _severity_weight(severity: Optional[str]) -> int:
-    sev = (severity or "").lower()
-    if sev == "critical":
-        return 4
-    if sev == "high":
-        return 3
-    if sev == "medium":
-        return 2
-    if sev == "mild":
-        return 1
-    return 0
+    return _SEVERITY_WEIGHTS.get((severity or "").lower(), 0)
 
 
 def _alert_priority_score(ioc: Dict[str, Any]) -> float:
@@ -856,9 +856,15 @@ def _load_tool_fingerprints(path: Path) -> List[Dict[str, Any]]:
     if not path.exists() or not path.is_dir():
         return []
     output: List[Dict[str, Any]] = []
-    for file in sorted(path.iterdir()):
-        if file.suffix not in {".json", ".jsonl"}:
-            continue
+    # One readdir; filter on the name before sorting so unrelated files are never stat'ed.
+    with os.scandir(path) as it:
+        names = sorted(
+            entry.name
+            for entry in it
+            if os.path.splitext(entry.name)[1] in {".json", ".jsonl"} and entry.is_file()
+        )
+    for name in names:
+        file = path / name
         try:
             if file.suffix == ".jsonl":
                 lines = file.read_text(encoding="utf-8").splitlines()
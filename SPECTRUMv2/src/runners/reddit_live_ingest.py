@@ -24,6 +24,11 @@ except ImportError:
     YAML_AVAILABLE = False
     yaml = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from src.adapters.reddit_adapter import adapt_reddit_items
 from src.adapters.emit_graph import emit_graph
 from db.alert_writer import write_alerts
@@ -472,9 +477,16 @@ def get_existing_elements() -> tuple[list[dict], list[dict]]:
     if not graph_path.exists():
         return [], []
     try:
-        els = json.loads(graph_path.read_text())
-        nodes = [e.get("data", {}) for e in els if not {"source", "target"} <= set((e.get("data") or {}).keys())]
-        edges = [e.get("data", {}) for e in els if {"source", "target"} <= set((e.get("data") or {}).keys())]
+        raw = graph_path.read_bytes()
+        try:
+            els = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except ValueError:
+            els = json.loads(raw)  # stdlib also accepts NaN/Infinity
+        nodes: list[dict] = []
+        edges: list[dict] = []
+        for e in els:
+            data = e.get("data") or {}
+            (edges if "source" in data and "target" in data else nodes).append(data)
         return nodes, edges
     except Exception:
         return [], []
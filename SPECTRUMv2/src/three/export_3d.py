@@ -12,10 +12,18 @@ from __future__ import annotations
 
 import json
 import math
+import os
+import tempfile
 import time
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Dict, List
 
+try:
+    import orjson
+except Exception:
+    orjson = None
+
 try:
     from sources.source_colors import SOURCE_COLORS as SOURCE_COLOR_MAP
 except Exception:
@@ -35,6 +43,9 @@ POS_PATH = ROOT / "data" / "graph_positions.json"
 OUT_PATH = ROOT / "data" / "graph_3d.json"
 SURV_PATH = ROOT / "data" / "surveillance.json"  # watch state persisted by Dash UI
 
+# Shared read-only default for missing data/state dicts; avoids a fresh {} per element.
+_EMPTY = MappingProxyType({})
+
 # ---- tuning (Apple Silicon friendly) ----
 MAX_NODES = 6000          # clamp for sanity; increase later if needed
 MAX_EDGES = 12000
@@ -60,14 +71,42 @@ XY_CLAMP = 1600.0             # keep layout bounded horizontally
 
 
 def _load_json(p: Path, default):
+    # Parse straight from bytes; orjson when available, else stdlib json.
     try:
-        return json.loads(p.read_text())
+        raw = p.read_bytes()
+        if orjson is not None:
+            try:
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                pass  # NaN/Infinity literals are only accepted by the stdlib decoder
+        return json.loads(raw)
     except Exception:
         return default
 
 
+def _write_json(p: Path, payload) -> None:
+    # Buffered dump to a unique temp file + rename so the viewer never reads a
+    # half-written graph and concurrent exporters don't share a temp path.
+    fd, tmp = tempfile.mkstemp(dir=p.parent, prefix=p.name + ".", suffix=".tmp")
+    try:
+        os.fchmod(fd, 0o644)
+        if orjson is not None:
+            with open(fd, "wb") as fh:
+                fh.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+        else:
+            with open(fd, "w", encoding="utf-8", buffering=1 << 20) as fh:
+                json.dump(payload, fh, indent=2)
+        os.replace(tmp, p)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
 def _is_edge(el: Dict[str, Any]) -> bool:
-    d = el.get("data", {})
+    d = el.get("data", _EMPTY)
     return "source" in d and "target" in d
 
 
@@ -122,13 +161,17 @@ def _z_from(node: Dict[str, Any], now: float) -> float:
     return max(-Z_CLAMP, min(Z_CLAMP, z))
 
 
+_RELATION_OPACITY = {
+    "source_cluster": 0.08,
+    "relation_cluster": 0.08,
+    "co_occurs_with": 0.32,
+    "same_as": 0.32,
+    "likely_same_as": 0.32,
+}
+
+
 def _edge_opacity(relation: str | None) -> float:
-    rel = (relation or "").lower()
-    if rel in {"source_cluster", "relation_cluster"}:
-        return 0.08
-    if rel in {"co_occurs_with", "same_as", "likely_same_as"}:
-        return 0.32
-    return 0.26
+    return _RELATION_OPACITY.get((relation or "").lower(), 0.26)
 
 
 def _force_layout(nodes: List[Dict[str, Any]], edges: List[Dict[str, Any]]) -> None:
@@ -188,7 +231,7 @@ def _force_layout(nodes: List[Dict[str, Any]], edges: List[Dict[str, Any]]) -> N
     anchors = [pos[:] for pos in positions]
     seed_dirs = []
     for n in nodes:
-        nid = str(n.get("id", ""))
+        nid = n["id"]  # nodes_out always carries the id; _hash_unit formats it
         angle = _hash_unit(nid, "dir") * (2 * math.pi)
         z = (_hash_unit(nid, "dirz") - 0.5) * 0.6
         seed_dirs.append((math.cos(angle), math.sin(angle), z))
@@ -375,30 +418,31 @@ def main() -> None:
         else:
             els = []
 
-    nodes_raw = [e for e in els if not _is_edge(e)]
-    edges_raw = [e for e in els if _is_edge(e)]
-
-    nodes_raw = nodes_raw[:MAX_NODES]
-    edges_raw = edges_raw[:MAX_EDGES]
+    # single pass: split nodes/edges and stop collecting each side once its cap is hit
+    nodes_raw: List[Dict[str, Any]] = []
+    edges_raw: List[Dict[str, Any]] = []
+    for e in els:
+        if _is_edge(e):
+            if len(edges_raw) < MAX_EDGES:
+                edges_raw.append(e)
+        elif len(nodes_raw) < MAX_NODES:
+            nodes_raw.append(e)
 
     nodes_out: List[Dict[str, Any]] = []
     id_set = set()
 
     # load persisted surveillance state (if present) so we can export it into 3D payload
-    try:
-        surv_store = json.loads(SURV_PATH.read_text()) if SURV_PATH.exists() else {}
-    except Exception:
-        surv_store = {}
+    surv_store = _load_json(SURV_PATH, {})
 
     for n in nodes_raw:
-        d = n.get("data", {})
+        d = n.get("data", _EMPTY)
         nid = d.get("id")
         if not nid or nid in id_set:
             continue
         id_set.add(nid)
-        s = surv_store.get(nid, {})
+        s = surv_store.get(nid, _EMPTY)
 
-        p = pos.get(nid) or n.get("position") or {}
+        p = pos.get(nid) or n.get("position") or _EMPTY
         has_pos = isinstance(p, dict) and ("x" in p and "y" in p)
         x = _safe_float(p.get("x", 0.0)) * XY_SCALE
         y = _safe_float(p.get("y", 0.0)) * XY_SCALE
@@ -473,13 +517,16 @@ def main() -> None:
 
     edges_out: List[Dict[str, Any]] = []
     for e in edges_raw:
-        d = e.get("data", {})
+        d = e.get("data", _EMPTY)
         s, t = d.get("source"), d.get("target")
         if not s or not t:
             continue
         if s not in id_set or t not in id_set:
             continue
-        opacity = _safe_float(d.get("edge_opacity", _edge_opacity(d.get("relation"))), 0.2)
+        if "edge_opacity" in d:
+            opacity = _safe_float(d["edge_opacity"], 0.2)
+        else:
+            opacity = _edge_opacity(d.get("relation"))
         edges_out.append(
             {
                 "id": d.get("id", f"{s}→{t}"),
@@ -507,10 +554,13 @@ def main() -> None:
         if t:
             deg[t] += 1
 
-    # annotate nodes with degree and identify top nodes
+    # annotate nodes with degree, collect surveillance ids, and identify top nodes
+    surv_nodes = set()
     for n in nodes_out:
         n_id = n.get("id")
         n["degree"] = int(deg.get(n_id, 0))
+        if n.get("surveillance"):
+            surv_nodes.add(n_id)
     MAX_PRESERVE = 300
     top_n = min(90, max(1, len(nodes_out)))
     top_ids = [nid for nid, _ in deg.most_common(top_n)]
@@ -523,22 +573,19 @@ def main() -> None:
             neighbor_map[s].add(t)
             neighbor_map[t].add(s)
 
-    preserved = list(top_ids)
+    top_set = set(top_ids)
+    preserved = set(top_ids)
     # greedily add neighbors until cap
-    for tid in list(top_ids):
+    for tid in top_ids:
         for nb in sorted(neighbor_map.get(tid, set()), key=lambda x: -deg.get(x, 0)):
-            if nb not in preserved:
-                preserved.append(nb)
+            preserved.add(nb)
             if len(preserved) >= MAX_PRESERVE:
                 break
         if len(preserved) >= MAX_PRESERVE:
             break
-    preserved = set(preserved)
 
     # also preserve nodes marked surveillance in stored data (if present) - ensure they are included
-    surv_nodes = {n.get("id") for n in nodes_out if n.get("surveillance")}
-    for nid in surv_nodes:
-        preserved.add(nid)
+    preserved |= surv_nodes
     # final cap: trim non-surveillance items if too many preserved, but never drop surv_nodes
     if len(preserved) > MAX_PRESERVE:
         non_surv = [x for x in preserved if x not in surv_nodes]
@@ -550,7 +597,7 @@ def main() -> None:
         if nid in preserved:
             n["live_preserve"] = True
             # reason label: top, neighbor, or surveillance (priority order)
-            if nid in top_ids:
+            if nid in top_set:
                 n["preserved_reason"] = "top"
             elif n.get("surveillance"):
                 n["preserved_reason"] = "surveillance"
@@ -589,9 +636,9 @@ def main() -> None:
             "sources": sources_list
         }
     }
-    OUT_PATH.write_text(json.dumps(payload, indent=2))
+    _write_json(OUT_PATH, payload)
     sources_path = ROOT / "data" / "sources.json"
-    sources_path.write_text(json.dumps({"sources": sources_list}, indent=2))
+    _write_json(sources_path, {"sources": sources_list})
     print(f"[export_3d] wrote {OUT_PATH} nodes={len(nodes_out)} edges={len(edges_out)} built_at={int(now)}")
 
 